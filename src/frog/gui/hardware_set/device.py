@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Mapping, Set
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
+from types import MappingProxyType
 from typing import Any
 
 from frozendict import frozendict
 from pubsub import pub
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from frog.device_info import DeviceInstanceRef
 from frog.gui.error_message import show_error_message
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenDeviceArgs:
     """Arguments needed to open a device."""
 
@@ -39,7 +41,7 @@ class OpenDeviceArgs:
         return cls(DeviceInstanceRef.from_str(instance), class_name, frozendict(params))
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveDeviceProperties:
     """The properties of a device that is connecting or connected."""
 
@@ -50,7 +52,7 @@ class ActiveDeviceProperties:
 
     def __post_init__(self) -> None:
         """Check whether user attempted to create for a disconnected device."""
-        if self.state == ConnectionStatus.DISCONNECTED:
+        if self.state is ConnectionStatus.DISCONNECTED:
             raise ValueError(
                 "Cannot create ActiveDeviceProperties for disconnected device"
             )
@@ -92,6 +94,12 @@ class ActiveDeviceManager(QObject):
         """Create a new _ActiveDeviceManager."""
         super().__init__()
         self._active_devices = active_devices or {}
+        self._connected_devices = {
+            props.args
+            for props in self._active_devices.values()
+            if props.state is ConnectionStatus.CONNECTED
+        }
+        """The arguments of active devices which are connected (not connecting)."""
         pub.subscribe(self._on_device_open_start, "device.before_opening")
         pub.subscribe(self._on_device_open_end, "device.after_opening")
         pub.subscribe(self._on_device_closed, "device.closed")
@@ -99,22 +107,18 @@ class ActiveDeviceManager(QObject):
 
     @property
     def devices(self) -> Mapping[DeviceInstanceRef, ActiveDeviceProperties]:
-        """The current active devices."""
-        return self._active_devices
+        """The current active devices (as a read-only view)."""
+        return MappingProxyType(self._active_devices)
 
     @property
-    def connected_devices(self) -> Iterable[OpenDeviceArgs]:
-        """Active devices which are connected (not connecting)."""
-        return (
-            props.args
-            for props in self._active_devices.values()
-            if props.state == ConnectionStatus.CONNECTED
-        )
+    def connected_devices(self) -> Set[OpenDeviceArgs]:
+        """Active devices which are connected (not connecting), as an immutable set."""
+        return frozenset(self._connected_devices)
 
     def disconnect_all(self) -> None:
         """Disconnect from all devices."""
         # We need to make a copy because keys will be removed as we close devices
-        for device in list(self._active_devices.keys()):
+        for device in tuple(self._active_devices):
             pub.sendMessage("device.close", instance=device)
 
     def _on_device_open_start(
@@ -123,6 +127,8 @@ class ActiveDeviceManager(QObject):
         """Store device open parameters and update GUI."""
         args = OpenDeviceArgs(instance, class_name, frozendict(params))
         dev_props = ActiveDeviceProperties(args, ConnectionStatus.CONNECTING)
+        if old_props := self._active_devices.get(instance):
+            self._connected_devices.discard(old_props.args)
         self._active_devices[instance] = dev_props
         self.device_started_open.emit(instance, class_name, params)
 
@@ -131,17 +137,19 @@ class ActiveDeviceManager(QObject):
         dev_props = self._active_devices[instance]
         dev_props.state = ConnectionStatus.CONNECTED
         assert dev_props.args.class_name == class_name
+        self._connected_devices.add(dev_props.args)
         self.device_opened.emit(instance, class_name)
 
     def _on_device_closed(self, instance: DeviceInstanceRef) -> None:
         """Remove instance from _connected devices and update GUI."""
         try:
             # Remove the device matching this instance type (there should be only one)
-            del self._active_devices[instance]
+            dev_props = self._active_devices.pop(instance)
         except KeyError:
             # No device of this type found
             pass
         else:
+            self._connected_devices.discard(dev_props.args)
             self.device_closed.emit(instance)
 
     def _on_device_error(
@@ -149,11 +157,19 @@ class ActiveDeviceManager(QObject):
     ) -> None:
         """Show an error message when something has gone wrong with the device.
 
+        The message box is shown from the Qt event loop rather than from within this
+        handler, as it is modal and would otherwise block the delivery of subsequent
+        pubsub messages (e.g. device.closed) until the user dismissed it.
+
         Todo:
             The name of the device isn't currently very human readable.
         """
-        show_error_message(
-            None,
-            f"A fatal error has occurred with the {instance!s} device: {error!s}",
-            title="Device error",
+        QTimer.singleShot(
+            0,
+            partial(
+                show_error_message,
+                None,
+                f"A fatal error has occurred with the {instance!s} device: {error!s}",
+                title="Device error",
+            ),
         )
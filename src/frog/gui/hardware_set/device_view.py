@@ -171,7 +171,7 @@ class DeviceTypeControl(QGroupBox):
         """
         if not device_types:
             raise ValueError("At least one device type must be specified")
-        if device_status == ConnectionStatus.DISCONNECTED:
+        if device_status is ConnectionStatus.DISCONNECTED:
             if active_device_type is not None:
                 raise ValueError(
                     "active_device_type supplied even though status is disconnected"
@@ -245,7 +245,7 @@ class DeviceTypeControl(QGroupBox):
         """Update the controls according to device connection status."""
         self._status_control.set_status(status)
 
-        if status == ConnectionStatus.DISCONNECTED:
+        if status is ConnectionStatus.DISCONNECTED:
             self._set_combos_enabled(True)
             self._open_close_btn.setText("Open")
         else:
@@ -363,7 +363,7 @@ class DeviceControl(QGroupBox):
     def _get_connected_device(self, instance: DeviceInstanceRef) -> str | None:
         """Get the class name of the connected device matching instance, if any."""
         device = self._device_manager.devices.get(instance, None)
-        if not device or device.state != ConnectionStatus.CONNECTED:
+        if not device or device.state is not ConnectionStatus.CONNECTED:
             return None
 
         return device.args.class_name
@@ -146,10 +146,7 @@ class ManageDevicesDialog(QDialog):
         The button will be enabled if any devices are connected (connecting devices
         don't count) and disabled otherwise.
         """
-        any_devices_connected = bool(
-            next(self._device_manager.connected_devices, None)  # type: ignore
-        )
-        self._save_btn.setEnabled(any_devices_connected)
+        self._save_btn.setEnabled(bool(self._device_manager.connected_devices))
 
 
 class HardwareSetsControl(QGroupBox):
@@ -230,10 +227,8 @@ class HardwareSetsControl(QGroupBox):
         """Enable or disable the connect and disconnect buttons as appropriate."""
         # Enable the "Connect" button if there are any devices left to connect for this
         # hardware set
-        connected_devices = set(self._device_manager.connected_devices)
-        all_connected = connected_devices.issuperset(
-            self._combo.current_hardware_set_devices
-        )
+        connected_devices = self._device_manager.connected_devices
+        all_connected = connected_devices >= self._combo.current_hardware_set_devices
         any_devices_connecting = len(connected_devices) < len(
             self._device_manager.devices
         )
@@ -262,9 +257,9 @@ class HardwareSetsControl(QGroupBox):
             str(path),
         )
 
-        # Open each of the devices in turn
+        # Open each of the devices which aren't already connected in turn
         for device in self._combo.current_hardware_set_devices.difference(
-            self._device_manager.devices
+            self._device_manager.connected_devices
         ):
             device.open()
 
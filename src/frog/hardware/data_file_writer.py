@@ -3,7 +3,7 @@
 import logging
 import os
 import platform
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from math import floor
 from pathlib import Path
@@ -115,6 +115,12 @@ class DataFileWriter:
         """Create a new DataFileWriter."""
         self._writer: Writer
         """The CSV writer."""
+        self._date: date | None = None
+        """The date of the last row written."""
+        self._midnight = datetime.min
+        """Midnight at the start of the day of the last row written."""
+        self._date_str = ""
+        """The formatted date for the last row written."""
 
         # Listen to open/close messages
         pub.subscribe(self.open, "data_file.open")
@@ -163,14 +169,19 @@ class DataFileWriter:
     @pubsub_errors("data_file.error")
     def write(self, time: datetime, temperatures: list[Decimal]) -> None:
         """Write temperature readings to the CSV file."""
-        # Also include timestamp as seconds since midnight
-        midnight = datetime(time.year, time.month, time.day)
-        secs_since_midnight = floor((time - midnight).total_seconds())
+        # Also include timestamp as seconds since midnight. The date only changes once
+        # per day, so only recompute midnight and the date string when it does.
+        day = time.date()
+        if day != self._date:
+            self._date = day
+            self._midnight = datetime(time.year, time.month, time.day)
+            self._date_str = time.strftime("%Y%m%d")
+        secs_since_midnight = floor((time - self._midnight).total_seconds())
 
         angle, is_moving = _get_stepper_motor_angle()
         self._writer.writerow(
             (
-                time.strftime("%Y%m%d"),
+                self._date_str,
                 time.strftime("%H:%M:%S"),
                 *(round(t, config.TEMPERATURE_PRECISION) for t in temperatures),
                 secs_since_midnight,
@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 import traceback
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from copy import deepcopy
 from enum import Enum
 from inspect import isabstract, signature
@@ -34,11 +34,18 @@ _base_types: set[type[Device]] = set()
 _device_types: set[type[Device]] = set()
 """Registry of concrete device types."""
 
+_plugins_loaded = False
+"""Whether load_all_plugins() has already been called."""
+
 
 def get_device_types() -> dict[DeviceBaseTypeInfo, list[DeviceTypeInfo]]:
     """Return info about device types grouped according to their base type."""
-    # Ensure all base types and device types have been registered
-    load_all_plugins()
+    # Ensure all base types and device types have been registered. Importing the
+    # plugins again would be a no-op, but walking the package tree is not free.
+    global _plugins_loaded
+    if not _plugins_loaded:
+        load_all_plugins()
+        _plugins_loaded = True
 
     # Get the base type info and sort it alphabetically by description
     base_types_info = sorted(
@@ -64,6 +71,55 @@ def get_device_types() -> dict[DeviceBaseTypeInfo, list[DeviceTypeInfo]]:
     return out
 
 
+class _LazySequence(Sequence):
+    """A sequence whose values are only computed when they are needed.
+
+    This allows for possible parameter values which are expensive to obtain (e.g. the
+    list of serial ports) to be retrieved only when the frontend asks for them. The
+    values are not cached here, so any caching (and invalidation) is up to the function
+    providing them.
+    """
+
+    def __init__(self, get_values: Callable[[], Sequence]) -> None:
+        """Create a new _LazySequence.
+
+        Args:
+            get_values: A function returning the values of the sequence
+        """
+        self._get_values = get_values
+
+    @property
+    def values(self) -> Sequence:
+        """The current values of the sequence."""
+        return self._get_values()
+
+    def __getitem__(self, index: Any) -> Any:
+        """Get the item(s) at the given index."""
+        return self.values[index]
+
+    def __len__(self) -> int:
+        """Get the number of values."""
+        return len(self.values)
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the values."""
+        return iter(self.values)
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether value is in the sequence."""
+        return value in self.values
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the values with those of another sequence."""
+        if isinstance(other, _LazySequence):
+            other = other.values
+        return self.values == other
+
+    def __deepcopy__(self, memo: dict) -> _LazySequence:
+        """Share the same instance between subclasses."""
+        return self
+
+
 class AbstractDevice(ABC):
     """An abstract base class for devices."""
 
@@ -81,13 +137,17 @@ class AbstractDevice(ABC):
 
     def __init_subclass__(
         cls,
-        parameters: Mapping[str, str | tuple[str, Sequence]] = {},
+        parameters: Mapping[
+            str, str | tuple[str, Sequence | Callable[[], Sequence]]
+        ] = {},
         async_open: bool | None = None,
     ) -> None:
         """Initialise a device class.
 
         Args:
-            parameters: Extra device parameters that this class requires
+            parameters: Extra device parameters that this class requires. Possible
+                        values can be given as a zero-argument function, in which case
+                        they are only computed when first needed
             async_open: Whether the device should be opened in the background
         """
         super().__init_subclass__()
@@ -106,7 +166,8 @@ class AbstractDevice(ABC):
 
     @classmethod
     def _add_parameters(
-        cls, parameters: Mapping[str, str | tuple[str, Sequence]]
+        cls,
+        parameters: Mapping[str, str | tuple[str, Sequence | Callable[[], Sequence]]],
     ) -> None:
         """Store extra device parameters in a class attribute."""
         arg_types = get_type_hints(cls.__init__)
@@ -132,7 +193,12 @@ class AbstractDevice(ABC):
                 cls._device_parameters[name] = DeviceParameter(value, arg_type)
             elif isinstance(value, tuple):
                 # A description and possible values provided
-                cls._device_parameters[name] = DeviceParameter(value[0], value[1])
+                description, possible_values = value
+                if callable(possible_values):
+                    possible_values = _LazySequence(possible_values)
+                cls._device_parameters[name] = DeviceParameter(
+                    description, possible_values
+                )
             else:
                 # Bad type
                 raise TypeError("Invalid parameters argument")
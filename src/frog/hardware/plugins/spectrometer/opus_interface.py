@@ -8,7 +8,7 @@ Note that this is a separate machine from the EM27!
 
 import logging
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from PySide6.QtCore import QTimer
 
 from frog.config import (
@@ -27,6 +27,9 @@ from frog.spectrometer_status import SpectrometerStatus
 STATUS_FILENAME = "stat.htm"
 COMMAND_FILENAME = "cmd.htm"
 
+_ID_TDS = SoupStrainer("td", id=True)
+"""Only the table cells with IDs are needed from OPUS's responses."""
+
 
 def parse_response(response: str) -> SpectrometerStatus:
     """Parse OPUS's HTML response."""
@@ -34,11 +37,8 @@ def parse_response(response: str) -> SpectrometerStatus:
     text: str | None = None
     errcode: int | None = None
     errtext: str = ""
-    soup = BeautifulSoup(response, "html.parser")
+    soup = BeautifulSoup(response, "html.parser", parse_only=_ID_TDS)
     for td in soup.find_all("td"):
-        if "id" not in td.attrs:
-            continue
-
         id = td.attrs["id"]
         data = td.contents[0] if td.contents else ""
         if id == "STATUS":
@@ -102,6 +102,8 @@ class OPUSInterface(
 
         self._status: SpectrometerStatus | None = None
         """The last known status of the spectrometer."""
+        self._last_response: str | None = None
+        """The last response from OPUS which was parsed successfully."""
         self._status_timer = QTimer()
         self._status_timer.timeout.connect(self._request_status)
         self._status_timer.setInterval(int(polling_interval * 1000))
@@ -116,16 +118,20 @@ class OPUSInterface(
 
     def handle_response(self, response: str):
         """Process HTTP response from OPUS."""
-        new_status = parse_response(response)
-
-        # If the status has changed, notify listeners
-        if new_status != self._status:
-            # On first update, we need to signal that the device is now open
-            if self._status is None:
-                self.signal_is_opened()
-
-            self._status = new_status
-            self.send_status_message(new_status)
+        # The status usually doesn't change between polls, in which case OPUS sends
+        # back an identical page that we don't need to parse again
+        if response != self._last_response:
+            new_status = parse_response(response)
+            self._last_response = response
+
+            # If the status has changed, notify listeners
+            if new_status is not self._status:
+                # On first update, we need to signal that the device is now open
+                if self._status is None:
+                    self.signal_is_opened()
+
+                self._status = new_status
+                self.send_status_message(new_status)
 
         # Poll the status again after a delay
         self._status_timer.start()
@@ -8,10 +8,11 @@ The specification is available online:
 """
 
 import logging
+import time
 from enum import IntFlag
 from queue import Queue
 
-from PySide6.QtCore import QThread, QTimer, Signal
+from PySide6.QtCore import QThread, Signal
 from serial import Serial, SerialException, SerialTimeoutException
 
 from frog.config import STEPPER_MOTOR_HOMING_TIMEOUT
@@ -57,6 +58,15 @@ _SEND_STRING_MAGIC = "Z"
 See ST10Controller._send_string() for details of this command.
 """
 
+_SEND_STRING_MAGIC_BYTES = _SEND_STRING_MAGIC.encode("ascii")
+"""The magic string as it is received from the device."""
+
+_READER_STOP_TIMEOUT = 2.0
+"""How long to wait for the reader thread to finish when closing the device."""
+
+_ASCII_ONE = ord("1")
+"""The byte value of a set bit in the device's input status string."""
+
 
 class _SerialReader(QThread):
     """For background reading from the serial device.
@@ -76,6 +86,9 @@ class _SerialReader(QThread):
 
     When the magic send string response is received, the async_read_completed signal is
     emitted. Synchronous reads are handled by putting received messages into a Queue.
+
+    If async_deadline is set and the magic send string response has not been received
+    by then, a read_error signal is emitted instead.
     """
 
     async_read_completed = Signal()
@@ -95,31 +108,55 @@ class _SerialReader(QThread):
 
         self.serial = serial
         self.sync_timeout = sync_timeout
-        self.out_queue: Queue[str | BaseException] = Queue()
+        self.out_queue: Queue[bytes | BaseException] = Queue()
         self.stopping = False
+        self.async_deadline: float | None = None
+        """Monotonic time by which the next asynchronous read must complete, if any."""
+        self._partial = b""
+        """Bytes of a message which were received before a read timed out."""
 
     def quit(self) -> None:
         """Flag that the thread is stopping so we can ignore exceptions."""
         self.stopping = True
         super().quit()
 
-    def _read(self) -> str:
+    def _read(self) -> bytes | None:
         """Read the next message from the device.
 
+        If async_deadline is set, the read will only block until the deadline. Messages
+        are checked to be ASCII, but are not decoded.
+
+        Returns:
+            The message or None if the deadline expired before a message was received
+
         Raises:
             SerialException: Error communicating with device
             SerialTimeoutException: Timed out waiting for response from device
             ST10ControllerError: Malformed message received from device
         """
-        raw = self.serial.read_until(b"\r")
+        # The serial timeout is only ever changed from this thread, because changing it
+        # reconfigures the port. If the deadline is cleared from another thread while a
+        # read is in progress, the read may time out early, but the next read will
+        # restore the blocking timeout.
+        deadline = self.async_deadline
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if timeout != self.serial.timeout:
+            self.serial.timeout = timeout
+
+        raw = self._partial + self.serial.read_until(b"\r")
+        if not raw.endswith(b"\r"):
+            # The read timed out, so keep what we have received for the next read
+            self._partial = raw
+            return None
+        self._partial = b""
 
         logging.debug(f"(ST10) <<< {raw!r}")
 
-        try:
-            return raw[:-1].decode("ascii")
-        except UnicodeDecodeError:
+        if not raw.isascii():
             raise ST10ControllerError(f"Invalid message received: {raw!r}")
 
+        return raw[:-1]
+
     def _read_error(self, error: BaseException) -> None:
         if self.stopping:
             return
@@ -130,9 +167,26 @@ class _SerialReader(QThread):
         # Also send error as a signal as there is not necessarily a synchronous waiter
         self.read_error.emit(error)
 
-    def _read_success(self, message: str) -> None:
+    def clear_async_deadline(self) -> None:
+        """Stop waiting for the current asynchronous read, if any.
+
+        This is safe to call from any thread. The serial timeout is reset by the reader
+        thread at the start of its next read.
+        """
+        self.async_deadline = None
+
+    def _read_timed_out(self) -> None:
+        if self.async_deadline is None:
+            return
+
+        # There is no synchronous waiter for the async read, so just send a signal
+        self.clear_async_deadline()
+        self.read_error.emit(RuntimeError("Timed out waiting for motor to move"))
+
+    def _read_success(self, message: bytes) -> None:
         # The motor is signalling that it has finished moving
-        if message == _SEND_STRING_MAGIC:
+        if message == _SEND_STRING_MAGIC_BYTES:
+            self.clear_async_deadline()
             self.async_read_completed.emit()
             return
 
@@ -150,15 +204,18 @@ class _SerialReader(QThread):
             # to recover in some situations
             return False
 
-        self._read_success(message)
+        if message is None:
+            self._read_timed_out()
+        else:
+            self._read_success(message)
         return True
 
     def run(self) -> None:
         """Process reads in the background."""
-        while self._process_read():
+        while not self.stopping and self._process_read():
             pass
 
-    def read_sync(self) -> str:
+    def read_sync(self) -> bytes:
         """Read synchronously from the serial device."""
         try:
             response = self.out_queue.get(timeout=self.sync_timeout)
@@ -238,16 +295,6 @@ class ST10Controller(
         self._reader.read_error.connect(self.send_error_message)
         self._reader.start()
 
-        self._init_error_timer = QTimer()
-        """A timer to raise an error if the motor takes too long to move."""
-        self._init_error_timer.setInterval(round(STEPPER_MOTOR_HOMING_TIMEOUT * 1000))
-        self._init_error_timer.setSingleShot(True)
-        self._init_error_timer.timeout.connect(
-            lambda: self.send_error_message(
-                RuntimeError("Timed out waiting for motor to move")
-            )
-        )
-
         # Check that we are connecting to an ST10
         self._check_model_id()
 
@@ -283,14 +330,17 @@ class ST10Controller(
         self._reader.quit()
 
         # If _reader is blocking on a read (which is likely), we could end up waiting
-        # forever, so close the socket so that the read operation will terminate
+        # forever, so interrupt the read and give the thread a chance to finish before
+        # closing the port. (Closing the port mid-read can also terminate the read, but
+        # may block on some platforms.)
+        self.serial.cancel_read()
+        if not self._reader.wait(round(_READER_STOP_TIMEOUT * 1000)):
+            logging.warning("Timed out waiting for ST10 reader thread to finish")
+
         SerialDevice.close(self)
 
     def _on_initial_move_end(self) -> None:
         """Perform setup after motor's initial move has completed successfully."""
-        # Move completed within time allotted
-        self._init_error_timer.stop()
-
         # For future move end messages, use a different handler
         self._reader.async_read_completed.disconnect(self._on_initial_move_end)
         self._reader.async_read_completed.connect(self._on_move_end)
@@ -320,7 +370,7 @@ class ST10Controller(
 
         # The string is composed of firmware version, model ID (and possible sub-model
         # code, which we ignore)
-        id_str = self._read_sync()
+        id_str = self._read_sync().decode("ascii")
         firmware_version = id_str[:4]
         model_id = id_str[4:7]
 
@@ -354,12 +404,13 @@ class ST10Controller(
         if input <= 0:
             raise ValueError("index must be greater than 0")
 
-        input_status = self._request_value("IS")
+        input_status = self._request_raw_value("IS")
 
         # The inputs are represented as ASCII zeroes and ones. The lowest input's value
-        # is on the right.
+        # is on the right. We only need one of them, so just look up its byte rather
+        # than decoding or parsing the whole string.
         try:
-            return input_status[-input] == "1"
+            return input_status[-input] == _ASCII_ONE
         except IndexError:
             raise ValueError(f"index exceeded number of inputs ({len(input_status)})")
 
@@ -386,23 +437,34 @@ class ST10Controller(
         if self._get_input_status(self.HOME_SWITCH_INPUT):
             self._relative_move(-5000)
 
-        # Home the motor, leaving mirror facing upwards. The command means "seek home
-        # until this input is high" (the input is an optoswitch).
-        self._write_check(f"SH{self.HOME_SWITCH_INPUT}H")
-
-        # Turn mirror so it's facing down
-        self._relative_move(round(self.STEPS_PER_ROTATION * nadir_offset / 360.0))
+        # Show an error if the motor doesn't finish moving within the given timeframe.
+        # (Note that the move commands are not run synchronously, so this time is the
+        # time taken for all of these commands to finish.)
+        #
+        # NB: The deadline must be set before the commands are sent. The reader thread
+        # only picks up a new deadline at the start of its next read, which works here
+        # because that read is the one that receives the ACK for the first command.
+        self._reader.async_deadline = time.monotonic() + STEPPER_MOTOR_HOMING_TIMEOUT
+
+        # Each of these commands only makes sense if the previous one succeeded, so they
+        # are sent one at a time and each response is checked before continuing
+        try:
+            # Home the motor, leaving mirror facing upwards. The command means "seek
+            # home until this input is high" (the input is an optoswitch).
+            self._write_check(f"SH{self.HOME_SWITCH_INPUT}H")
 
-        # Tell the controller that this is step 0 ("set variable SP to 0")
-        self._write_check("SP0")
+            # Turn mirror so it's facing down
+            self._relative_move(round(self.STEPS_PER_ROTATION * nadir_offset / 360.0))
 
-        # Use a timer to show an error if the motor doesn't finish moving within the
-        # given timeframe. (Note that the move commands are not run synchronously, so
-        # this time is the time taken for all of these commands to finish.)
-        self._init_error_timer.start()
+            # Tell the controller that this is step 0 ("set variable SP to 0")
+            self._write_check("SP0")
 
-        # Receive a notification when motor has finished moving
-        self._notify_on_stopped()
+            # Receive a notification when motor has finished moving
+            self._notify_on_stopped()
+        except Exception:
+            # Otherwise a spurious timeout error would be sent later
+            self._reader.clear_async_deadline()
+            raise
 
     def _relative_move(self, steps: int) -> None:
         """Move the stepper motor to the specified relative position.
@@ -485,9 +547,11 @@ class ST10Controller(
         # "Send string"
         self._write_check(f"SS{string}")
 
-    def _read_sync(self) -> str:
+    def _read_sync(self) -> bytes:
         """Read the next message from the device synchronously.
 
+        The message is returned undecoded, but is guaranteed to be ASCII.
+
         Raises:
             SerialException: Error communicating with device
             ST10ControllerError: Malformed message received from device
@@ -545,16 +609,18 @@ class ST10Controller(
         response = self._read_sync()
 
         # Either type of ACK response is acceptable
-        if response in ("%", "*"):
+        if response in (b"%", b"*"):
             return
 
         # An error occurred (NACK)
-        if response[0] == "?":
+        if response.startswith(b"?"):
             raise ST10ControllerError(
-                f"Device returned an error (code: {response[1:]})"
+                f"Device returned an error (code: {response[1:].decode('ascii')})"
             )
 
-        raise ST10ControllerError(f"Unexpected response from device: {response}")
+        raise ST10ControllerError(
+            f"Unexpected response from device: {response.decode('ascii')}"
+        )
 
     def _request_value(self, name: str) -> str:
         """Request a named value from the device.
@@ -562,6 +628,20 @@ class ST10Controller(
         You can request the values of various variables, which all seem to have
         two-letter names.
 
+        Args:
+            name: Variable name
+
+        Raises:
+            SerialException: Error communicating with device
+            SerialTimeoutException: Timed out waiting for response from device
+            ST10ControllerError: Malformed message received from device
+            UnicodeEncodeError: Message to be sent is malformed
+        """
+        return self._request_raw_value(name).decode("ascii")
+
+    def _request_raw_value(self, name: str) -> bytes:
+        """Request a named value from the device without decoding it.
+
         Args:
             name: Variable name
 
@@ -573,10 +653,11 @@ class ST10Controller(
         """
         self._write(name)
         response = self._read_sync()
-        if not response.startswith(f"{name}="):
+        prefix = f"{name}=".encode("ascii")
+        if not response.startswith(prefix):
             raise ST10ControllerError(f"Unexpected response when querying value {name}")
 
-        return response[len(name) + 1 :]
+        return response[len(prefix) :]
 
     def _request_int(self, name: str, base: int = 10) -> int:
         """Request a named value from the device and interpret the result as an int.
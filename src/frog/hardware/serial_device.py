@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import logging
-import re
-from collections import Counter
+import os
+import time
 
 from serial import Serial, SerialException
 from serial.tools.list_ports import comports
@@ -12,7 +12,32 @@ from serial.tools.list_ports import comports
 from frog.config import BAUDRATES
 from frog.hardware.device import AbstractDevice
 
+_SERIAL_PORTS_MIN_REFRESH_INTERVAL = 0.5
+"""The minimum time between rescans of the serial ports (seconds)."""
+_DEVICE_DIR = "/dev"
+"""The directory containing device nodes (only used on POSIX systems)."""
+
 _serial_ports: dict[str, str] | None = None
+_serial_ports_time = float("-inf")
+"""When _serial_ports was last updated (according to time.monotonic())."""
+_serial_ports_dev_mtime: float | None = None
+"""The modification time of _DEVICE_DIR when _serial_ports was last updated."""
+
+
+def _get_device_dir_mtime() -> float | None:
+    """Get the modification time of the device directory.
+
+    On POSIX systems this changes whenever a device node is added or removed (e.g. when
+    a USB serial adapter is plugged in). None is returned on other systems (e.g.
+    Windows) or if the directory can't be accessed.
+    """
+    if os.name != "posix":
+        return None
+
+    try:
+        return os.stat(_DEVICE_DIR).st_mtime
+    except OSError:
+        return None
 
 
 def _port_info_to_str(vendor_id: int, product_id: int, count: int = 0) -> str:
@@ -23,10 +48,9 @@ def _port_info_to_str(vendor_id: int, product_id: int, count: int = 0) -> str:
         product_id: USB product ID
         count: Extra field to distinguish devices
     """
-    out = f"{vendor_id:04x}:{product_id:04x}"
-    if count > 0:
-        out += f" ({count + 1})"
-    return out
+    if count == 0:
+        return f"{vendor_id:04x}:{product_id:04x}"
+    return f"{vendor_id:04x}:{product_id:04x} ({count + 1})"
 
 
 def _get_port_parts(port: str) -> tuple[str, int]:
@@ -34,15 +58,13 @@ def _get_port_parts(port: str) -> tuple[str, int]:
 
     If there is no number at the end of the string, (port, -1) will be returned.
     """
-    match = re.match("^([^0-9])*([0-9]*)$", port)
-
-    # NB: This should never fail as the regex should encompass all strings
-    assert match, "Invalid port name"
+    # Find where the trailing digits (if any) start
+    i = len(port)
+    while i and port[i - 1].isdecimal():
+        i -= 1
 
-    num_str = match.group(2)
-    num = int(num_str) if num_str else -1
-
-    return match.group(1), num
+    num = int(port[i:]) if i < len(port) else -1
+    return port[:i], num
 
 
 def _port_and_desc_to_str(port: str, desc: str) -> str:
@@ -57,30 +79,54 @@ def _get_serial_ports(refresh: bool = False) -> dict[str, str]:
     """Get the ports for connected serial devices.
 
     The list of ports is only requested from the OS once and the result is cached,
-    unless the refresh argument is set to true.
+    unless the refresh argument is set to true. To avoid rescanning repeatedly when
+    several devices fail to connect at once, refresh is ignored if the list was last
+    updated less than _SERIAL_PORTS_MIN_REFRESH_INTERVAL seconds ago.
+
+    Where the OS provides a device directory (i.e. not on Windows), the list is also
+    refreshed automatically if the directory has been modified since the last scan.
 
     Args:
         refresh: Refresh the list of serial ports even if they have already been
                  requested
     """
-    global _serial_ports
-    if _serial_ports is not None and not refresh:
+    global _serial_ports, _serial_ports_time, _serial_ports_dev_mtime
+    dev_mtime = _get_device_dir_mtime()
+    if (
+        _serial_ports is not None
+        and dev_mtime == _serial_ports_dev_mtime
+        and (
+            not refresh
+            or time.monotonic() - _serial_ports_time
+            < _SERIAL_PORTS_MIN_REFRESH_INTERVAL
+        )
+    ):
         return _serial_ports
 
     # Keep track of ports with the same vendor and product ID and assign them an
-    # additional number to distinguish them
-    counter: Counter[tuple[int, int]] = Counter()
-    _serial_ports = {}
+    # additional number to distinguish them. The ports are sorted by name first so
+    # that these numbers are assigned in a consistent order.
+    counts: dict[tuple[int, int], int] = {}
+    entries: list[tuple[str, str]] = []
     for port in sorted(comports(), key=lambda port: _get_port_parts(port.device)):
+        device, vid, pid = port.device, port.vid, port.pid
+
         # Vendor ID is a USB-specific field, so we can use this to check whether the
         # device is USB or not
-        if port.vid is None:
-            _serial_ports[port.device] = port.device
+        if vid is None:
+            entries.append((device, device))
             continue
 
-        key = (port.vid, port.pid)
-        _serial_ports[_port_info_to_str(*key, counter[key])] = port.device
-        counter[key] += 1
+        key = (vid, pid)
+        count = counts.get(key, 0)
+        entries.append((_port_info_to_str(vid, pid, count), device))
+        counts[key] = count + 1
+
+    # Sort by the string representation of the key
+    entries.sort()
+    _serial_ports = dict(entries)
+    _serial_ports_time = time.monotonic()
+    _serial_ports_dev_mtime = dev_mtime
 
     if not _serial_ports:
         logging.warning("No serial devices found")
@@ -91,9 +137,6 @@ def _get_serial_ports(refresh: bool = False) -> dict[str, str]:
         )
         logging.info(f"Found the following serial devices:{port_strs}")
 
-    # Sort by the string representation of the key
-    _serial_ports = dict(sorted(_serial_ports.items(), key=lambda item: item[0]))
-
     return _serial_ports
 
 
@@ -118,10 +161,7 @@ def _create_serial(port: str, baudrate: int, refresh: bool) -> Serial:
 class SerialDevice(
     AbstractDevice,
     parameters={
-        "port": (
-            "Serial port",
-            tuple(_get_serial_ports().keys()),
-        ),
+        "port": ("Serial port", lambda: tuple(_get_serial_ports())),
         "baudrate": ("Baud rate", BAUDRATES),
     },
 ):
@@ -1,5 +1,6 @@
 """Test the ActiveDeviceManager class."""
 
+from types import MappingProxyType
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -13,15 +14,20 @@ from frog.gui.hardware_set.device import (
     OpenDeviceArgs,
 )
 
+SAMPLE_DEVICE_ARGS = OpenDeviceArgs(
+    instance=DeviceInstanceRef("test_base_type", "test_name"),
+    class_name="TestDevice",
+    params=frozendict({"param1": "value1", "param2": 42}),
+)
+
 
 @pytest.fixture
 def sample_device_args() -> OpenDeviceArgs:
-    """Create sample OpenDeviceArgs for testing."""
-    return OpenDeviceArgs(
-        instance=DeviceInstanceRef("test_base_type", "test_name"),
-        class_name="TestDevice",
-        params=frozendict({"param1": "value1", "param2": 42}),
-    )
+    """Get sample OpenDeviceArgs for testing.
+
+    OpenDeviceArgs is immutable, so the same object can be shared between tests.
+    """
+    return SAMPLE_DEVICE_ARGS
 
 
 @pytest.fixture
@@ -89,8 +95,8 @@ def test_devices_property(
     devices = manager.devices
 
     assert devices == active_devices_dict
-    # Ensure it's a mapping, not the actual dict for encapsulation
-    assert type(devices) is dict
+    # Ensure it's a read-only view, not a copy of the dict
+    assert isinstance(devices, MappingProxyType)
 
 
 def test_connected_devices_property_empty(subscribe_mock: MagicMock, qtbot) -> None:
@@ -133,6 +139,26 @@ def test_connected_devices_property_mixed_states(
     assert connected[0] == sample_device_args
 
 
+def test_connected_devices_property_read_only(
+    active_devices_dict: dict[DeviceInstanceRef, ActiveDeviceProperties],
+    sample_device_args: OpenDeviceArgs,
+    subscribe_mock: MagicMock,
+    qtbot,
+) -> None:
+    """Test that the connected_devices property can't be used to modify the manager."""
+    manager = ActiveDeviceManager(active_devices_dict)
+    connected = manager.connected_devices
+
+    with pytest.raises(AttributeError):
+        connected.discard(sample_device_args)  # type: ignore[attr-defined]
+    assert manager.connected_devices == {sample_device_args}
+
+    # Later changes to the manager shouldn't affect the returned set either
+    manager._on_device_closed(sample_device_args.instance)
+    assert connected == {sample_device_args}
+    assert not manager.connected_devices
+
+
 def test_on_device_open_start(subscribe_mock: MagicMock, qtbot) -> None:
     """Test _on_device_open_start method."""
     manager = ActiveDeviceManager()
@@ -153,7 +179,29 @@ def test_on_device_open_start(subscribe_mock: MagicMock, qtbot) -> None:
     assert device_props.args.instance == instance
     assert device_props.args.class_name == class_name
     assert device_props.args.params == frozendict(params)
-    assert device_props.state == ConnectionStatus.CONNECTING
+    assert device_props.state is ConnectionStatus.CONNECTING
+
+
+def test_on_device_open_start_frozen_params(subscribe_mock: MagicMock, qtbot) -> None:
+    """Test that _on_device_open_start() doesn't copy params which are frozen."""
+    manager = ActiveDeviceManager()
+    instance = DeviceInstanceRef("test_type")
+    params = frozendict(param1="value1")
+    manager._on_device_open_start(instance, "TestDevice", params)
+    assert manager.devices[instance].args.params is params
+
+
+def test_on_device_open_start_replaces_connected(
+    active_devices_dict: dict[DeviceInstanceRef, ActiveDeviceProperties],
+    subscribe_mock: MagicMock,
+    qtbot,
+) -> None:
+    """Test _on_device_open_start() when reopening a connected device."""
+    manager = ActiveDeviceManager(active_devices_dict)
+    instance = next(iter(active_devices_dict.keys()))
+
+    manager._on_device_open_start(instance, "OtherDevice", {})
+    assert not manager.connected_devices
 
 
 def test_on_device_open_end(
@@ -181,7 +229,8 @@ def test_on_device_open_end(
 
     # Check state change
     device_props = manager._active_devices[instance]
-    assert device_props.state == ConnectionStatus.CONNECTED
+    assert device_props.state is ConnectionStatus.CONNECTED
+    assert manager.connected_devices == {sample_device_properties.args}
 
 
 def test_on_device_closed_existing_device(
@@ -202,6 +251,7 @@ def test_on_device_closed_existing_device(
     # Check device removal
     assert instance not in manager._active_devices
     assert len(manager._active_devices) == 0
+    assert not manager.connected_devices
 
 
 def test_on_device_closed_nonexistent_device(subscribe_mock: MagicMock, qtbot) -> None:
@@ -262,6 +312,10 @@ def test_on_device_error(
 
     manager._on_device_error(instance, error)
 
+    # The message box should only be shown once control returns to the event loop
+    show_error_mock.assert_not_called()
+    qtbot.waitUntil(lambda: show_error_mock.called)
+
     # Check error message display
     show_error_mock.assert_called_once_with(
         None,
@@ -16,6 +16,7 @@ DEVICE_TYPES = [
     DeviceTypeInfo("my_class1", "Device 1"),
     DeviceTypeInfo("my_class2", "Device 2"),
 ]
+DEVICE_TYPE_DESCRIPTIONS = [t.description for t in DEVICE_TYPES]
 
 
 @pytest.fixture
@@ -77,13 +78,13 @@ def test_init(
     items = [
         widget._device_combo.itemText(i) for i in range(widget._device_combo.count())
     ]
-    assert items == [t.description for t in DEVICE_TYPES]
+    assert items == DEVICE_TYPE_DESCRIPTIONS
     assert [w.device_type for w in widget._device_widgets] == DEVICE_TYPES
 
     assert widget._device_combo.currentText() == expected_device.description
 
     if (
-        device_status != ConnectionStatus.DISCONNECTED
+        device_status is not ConnectionStatus.DISCONNECTED
         and active_device.class_name == expected_device.class_name  # type: ignore[union-attr]
     ):
         assert widget._open_close_btn.text() == "Close"
@@ -115,24 +116,28 @@ def test_set_device_status_active(
     status: ConnectionStatus, widget: DeviceTypeControl
 ) -> None:
     """Test the _set_device_status() method for connecting and connected devices."""
-    with patch.object(widget._status_control, "set_status") as set_status_mock:
-        with patch.object(widget, "_set_combos_enabled") as combos_mock:
-            with patch.object(widget._open_close_btn, "setText") as set_btn_text_mock:
-                widget._set_device_status(status)
-                set_status_mock.assert_called_once_with(status)
-                combos_mock.assert_called_once_with(False)
-                set_btn_text_mock("Close")
+    with (
+        patch.object(widget._status_control, "set_status") as set_status_mock,
+        patch.object(widget, "_set_combos_enabled") as combos_mock,
+        patch.object(widget._open_close_btn, "setText") as set_btn_text_mock,
+    ):
+        widget._set_device_status(status)
+        set_status_mock.assert_called_once_with(status)
+        combos_mock.assert_called_once_with(False)
+        set_btn_text_mock("Close")
 
 
 def test_set_device_status_disconnected(widget: DeviceTypeControl) -> None:
     """Test the _set_device_status() method for disconnected devices."""
-    with patch.object(widget._status_control, "set_status") as set_status_mock:
-        with patch.object(widget, "_set_combos_enabled") as combos_mock:
-            with patch.object(widget._open_close_btn, "setText") as set_btn_text_mock:
-                widget._set_device_status(ConnectionStatus.DISCONNECTED)
-                set_status_mock.assert_called_once_with(ConnectionStatus.DISCONNECTED)
-                combos_mock.assert_called_once_with(True)
-                set_btn_text_mock("Open")
+    with (
+        patch.object(widget._status_control, "set_status") as set_status_mock,
+        patch.object(widget, "_set_combos_enabled") as combos_mock,
+        patch.object(widget._open_close_btn, "setText") as set_btn_text_mock,
+    ):
+        widget._set_device_status(ConnectionStatus.DISCONNECTED)
+        set_status_mock.assert_called_once_with(ConnectionStatus.DISCONNECTED)
+        combos_mock.assert_called_once_with(True)
+        set_btn_text_mock("Open")
 
 
 @pytest.mark.parametrize(
@@ -201,7 +206,7 @@ def test_set_combos_enabled(
     widget_mock: Mock, enable: bool, widget: DeviceTypeControl, qtbot
 ) -> None:
     """Test the _set_combos_enabled() method."""
-    device_widget = MagicMock()
+    device_widget = MagicMock(spec=DeviceParametersWidget)
     widget_mock.return_value = device_widget
     with patch.object(widget, "_device_combo") as combo_mock:
         widget._set_combos_enabled(enable)
@@ -267,22 +272,24 @@ def test_close_device(
 
 def test_on_device_open_start(widget: DeviceTypeControl, qtbot) -> None:
     """Test the _on_device_open_start() method."""
-    with patch.object(widget, "_select_device") as select_mock:
-        with patch.object(widget, "_set_device_status") as set_status_mock:
-            widget._on_device_open_start(
-                DeviceInstanceRef("base_type"), "some_class", {}
-            )
-            select_mock.assert_called_once_with("some_class")
-            set_status_mock(ConnectionStatus.CONNECTING)
+    with (
+        patch.object(widget, "_select_device") as select_mock,
+        patch.object(widget, "_set_device_status") as set_status_mock,
+    ):
+        widget._on_device_open_start(DeviceInstanceRef("base_type"), "some_class", {})
+        select_mock.assert_called_once_with("some_class")
+        set_status_mock(ConnectionStatus.CONNECTING)
 
 
 def test_on_device_open_end(widget: DeviceTypeControl, qtbot) -> None:
     """Test the _on_device_open_end() method."""
-    with patch.object(widget, "_select_device") as select_mock:
-        with patch.object(widget, "_set_device_status") as set_status_mock:
-            widget._on_device_open_end(DeviceInstanceRef("base_type"), "some_class")
-            select_mock.assert_called_once_with("some_class")
-            set_status_mock(ConnectionStatus.CONNECTED)
+    with (
+        patch.object(widget, "_select_device") as select_mock,
+        patch.object(widget, "_set_device_status") as set_status_mock,
+    ):
+        widget._on_device_open_end(DeviceInstanceRef("base_type"), "some_class")
+        select_mock.assert_called_once_with("some_class")
+        set_status_mock(ConnectionStatus.CONNECTED)
 
 
 def test_on_device_closed(widget: DeviceTypeControl, qtbot) -> None:
@@ -294,15 +301,17 @@ def test_on_device_closed(widget: DeviceTypeControl, qtbot) -> None:
 
 def test_open_close_btn(widget: DeviceTypeControl, qtbot) -> None:
     """Test the open/close button works."""
-    with patch.object(widget, "_open_device") as open_mock:
-        with patch.object(widget, "_close_device") as close_mock:
-            assert widget._open_close_btn.text() == "Open"
-            widget._open_close_btn.click()
-            open_mock.assert_called_once_with()
-            close_mock.assert_not_called()
-
-            open_mock.reset_mock()
-            widget._open_close_btn.setText("Close")
-            widget._open_close_btn.click()
-            open_mock.assert_not_called()
-            close_mock.assert_called_once_with()
+    with (
+        patch.object(widget, "_open_device") as open_mock,
+        patch.object(widget, "_close_device") as close_mock,
+    ):
+        assert widget._open_close_btn.text() == "Open"
+        widget._open_close_btn.click()
+        open_mock.assert_called_once_with()
+        close_mock.assert_not_called()
+
+        open_mock.reset_mock()
+        widget._open_close_btn.setText("Close")
+        widget._open_close_btn.click()
+        open_mock.assert_not_called()
+        close_mock.assert_called_once_with()
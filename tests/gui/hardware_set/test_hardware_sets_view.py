@@ -216,6 +216,7 @@ def test_connect_btn(
             ],
             any_order=True,
         )
+        assert open_mock.call_count == len(open_called)
 
         settings_mock.setValue.assert_called_once_with(
             "hardware_set/selected", str(file_path)
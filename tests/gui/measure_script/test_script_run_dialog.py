@@ -2,7 +2,7 @@
 
 from pathlib import Path
 from typing import cast
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 from PySide6.QtWidgets import QDialogButtonBox, QProgressBar
@@ -69,11 +69,12 @@ def test_init(
         set_max_mock.assert_called_once_with("MAGIC")
 
         # Check that we're subscribed to the relevant measure script messages
-        subscribe_mock.assert_any_call(
-            dialog._on_start_moving, "measure_script.start_moving"
-        )
-        subscribe_mock.assert_any_call(
-            dialog._on_start_measuring, "measure_script.start_measuring"
+        subscribe_mock.assert_has_calls(
+            (
+                call(dialog._on_start_moving, "measure_script.start_moving"),
+                call(dialog._on_start_measuring, "measure_script.start_measuring"),
+            ),
+            any_order=True,
         )
 
 
@@ -146,8 +146,13 @@ def test_start_measuring(
     runner.start_measuring()
     assert runner.current_state == ScriptRunner.measuring
 
-    sendmsg_mock.assert_any_call(f"device.{SPECTROMETER_TOPIC}.start_measuring")
-    sendmsg_mock.assert_any_call("measure_script.start_measuring", script_runner=runner)
+    sendmsg_mock.assert_has_calls(
+        (
+            call(f"device.{SPECTROMETER_TOPIC}.start_measuring"),
+            call("measure_script.start_measuring", script_runner=runner),
+        ),
+        any_order=True,
+    )
 
 
 def test_repeat_measuring(
@@ -218,25 +223,24 @@ def test_measuring_end(
     """
     runner_measuring.current_measurement_count = current_measurement_repeat
 
-    with patch.object(runner_measuring, "start_next_move") as start_next_move_mock:
-        with patch.object(
-            runner_measuring, "repeat_measuring"
-        ) as repeat_measuring_mock:
-            runner_measuring._measuring_end(SpectrometerStatus.CONNECTED)
+    with (
+        patch.object(runner_measuring, "start_next_move") as start_next_move_mock,
+        patch.object(runner_measuring, "repeat_measuring") as repeat_measuring_mock,
+    ):
+        runner_measuring._measuring_end(SpectrometerStatus.CONNECTED)
 
-            assert (
-                runner_measuring.current_measurement_count
-                == current_measurement_repeat + 1
-            )
-            if (
-                runner_measuring.current_measurement_count
-                == runner_measuring.current_measurement.measurements
-            ):
-                start_next_move_mock.assert_called_once()
-                repeat_measuring_mock.assert_not_called()
-            else:
-                start_next_move_mock.assert_not_called()
-                repeat_measuring_mock.assert_called_once()
+        assert (
+            runner_measuring.current_measurement_count == current_measurement_repeat + 1
+        )
+        if (
+            runner_measuring.current_measurement_count
+            == runner_measuring.current_measurement.measurements
+        ):
+            start_next_move_mock.assert_called_once()
+            repeat_measuring_mock.assert_not_called()
+        else:
+            start_next_move_mock.assert_not_called()
+            repeat_measuring_mock.assert_called_once()
 
 
 def test_start_next_move_paused(runner_measuring: ScriptRunner) -> None:
@@ -2,11 +2,10 @@
 
 import json
 from collections.abc import Sequence
-from itertools import chain, combinations, product
+from itertools import combinations, product
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from freezegun import freeze_time
 
 from frog.config import DECADES_URL
 from frog.hardware.plugins.sensors.decades import (
@@ -36,21 +35,21 @@ def test_init(params: Sequence[str], qtbot) -> None:
 PARAMS = [DecadesParameter("a", "A", "m"), DecadesParameter("b", "B", "J")]
 """Example parameters."""
 
+PARAM_SUBSETS = tuple(frozenset(c) for n in range(3) for c in combinations("ab", n))
+"""All subsets of the example parameter names, starting with the empty set."""
+
 
-@patch("json.loads")
 @patch("frog.hardware.plugins.sensors.decades.Decades._get_decades_data")
-def test_handle_response(
-    get_decades_data_mock: Mock, json_loads_mock: Mock, decades: Decades
-) -> None:
+def test_handle_response(get_decades_data_mock: Mock, decades: Decades) -> None:
     """Test the handle_response() method processes sensor readings correctly."""
-    response = "RESPONSE"
+    response = '{"a": [1.0]}'
     get_decades_data_mock.return_value = range(3)
 
     # Check send_readings_message() is called
     with patch.object(decades, "send_readings_message") as send_readings_mock:
         decades.handle_response(response)
         send_readings_mock.assert_called_once_with((0, 1, 2))
-        json_loads_mock.assert_called_once_with(response)
+        get_decades_data_mock.assert_called_once_with({"a": [1.0]})
 
 
 def test_obtain_parameter_list(decades: Decades) -> None:
@@ -101,9 +100,10 @@ def test_on_params_received(params: set[str], decades: Decades) -> None:
         start_mock.assert_called_once_with()
 
 
-@freeze_time("1970-01-01 00:01:00")
-def test_request_readings(decades: Decades) -> None:
+@patch("frog.hardware.plugins.sensors.decades.time")
+def test_request_readings(time_mock: Mock, decades: Decades) -> None:
     """Tests the request_readings() method."""
+    time_mock.time.return_value = 60.0
     decades._params = PARAMS
     with patch.object(decades, "make_request") as make_request_mock:
         decades.request_readings()
@@ -111,41 +111,26 @@ def test_request_readings(decades: Decades) -> None:
         make_request_mock.assert_called_once_with(query)
 
 
+@pytest.mark.parametrize(
+    "params,expected_warnings",
+    ((PARAMS, 0), ([*PARAMS, DecadesParameter("c", "C", "V")], 1)),
+)
 @patch("frog.hardware.plugins.sensors.decades.logging.warn")
-def test_get_decades_data(warn_mock: Mock, decades: Decades) -> None:
-    """Tests the get_decades_data() function on normal data."""
-    decades._params = PARAMS
-    data = tuple(decades._get_decades_data({"a": [1.0], "b": [2.0]}))
-    assert data == (SensorReading("A", 1.0, "m"), SensorReading("B", 2.0, "J"))
-    warn_mock.assert_not_called()
-
-
-@patch("frog.hardware.plugins.sensors.decades.logging.warn")
-def test_get_decades_data_missing(warn_mock: Mock, decades: Decades) -> None:
-    """Tests the get_decades_data() function for when there are missing data."""
-    params = [
-        DecadesParameter("a", "A", "m"),
-        DecadesParameter("b", "B", "J"),
-        DecadesParameter("c", "C", "V"),
-    ]
+def test_get_decades_data(
+    warn_mock: Mock,
+    params: list[DecadesParameter],
+    expected_warnings: int,
+    decades: Decades,
+) -> None:
+    """Tests the get_decades_data() function, including when there are missing data."""
     decades._params = params
     data = tuple(decades._get_decades_data({"a": [1.0], "b": [2.0]}))
     assert data == (SensorReading("A", 1.0, "m"), SensorReading("B", 2.0, "J"))
-    warn_mock.assert_called_once()
+    assert warn_mock.call_count == expected_warnings
 
 
-@pytest.mark.parametrize(
-    "params,available",
-    product(
-        chain.from_iterable(
-            (set(c) for c in combinations("ab", n)) for n in range(1, 3)
-        ),
-        chain.from_iterable(
-            (set(c) for c in combinations("ab", n)) for n in range(0, 3)
-        ),
-    ),
-)
-def test_get_selected_params(params: set[str], available: set[str]) -> None:
+@pytest.mark.parametrize("params,available", product(PARAM_SUBSETS[1:], PARAM_SUBSETS))
+def test_get_selected_params(params: frozenset[str], available: frozenset[str]) -> None:
     """Test the _get_selected_params() function."""
     all_params_info = (
         {
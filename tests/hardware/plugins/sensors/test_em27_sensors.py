@@ -45,7 +45,7 @@ def test_init() -> None:
 
 @patch("frog.hardware.plugins.sensors.em27_sensors.get_em27_sensor_data")
 def test_handle_response(
-    get_em27_sensor_data_mock: Mock, em27_sensors: EM27Sensors, qtbot
+    get_em27_sensor_data_mock: Mock, em27_sensors: EM27Sensors
 ) -> None:
     """Test the _on_reply_received() method works when no error occurs."""
     # NB: This value is of the wrong type, but it doesn't matter here
@@ -58,7 +58,7 @@ def test_handle_response(
 
 @patch("frog.hardware.plugins.sensors.em27_sensors.get_em27_sensor_data")
 def test_handle_response_exception(
-    get_em27_sensor_data_mock: Mock, em27_sensors: EM27Sensors, qtbot
+    get_em27_sensor_data_mock: Mock, em27_sensors: EM27Sensors
 ) -> None:
     """Test the handle_response() method works when an exception is raised."""
     # Make get_em27_sensor_data() raise an exception
@@ -75,11 +75,11 @@ def test_get_em27_sensor_data() -> None:
     Read in the snapshot of the EM27 webpage and ensure that
     the sensor data is correctly extracted from it.
     """
-    dummy_em27_fp = resources.files("frog.hardware.plugins.sensors").joinpath(
-        "diag_autom.htm"
+    content = (
+        resources.files("frog.hardware.plugins.sensors")
+        .joinpath("diag_autom.htm")
+        .read_text()
     )
-    with dummy_em27_fp.open() as f:
-        content = f.read()
     data_table = get_em27_sensor_data(content)
     assert len(data_table) == 7
     for entry in data_table:
@@ -14,6 +14,9 @@ from frog.hardware.plugins.spectrometer.opus_interface import (
 )
 from frog.spectrometer_status import SpectrometerStatus
 
+RESPONSE = "RESPONSE"
+"""A placeholder response for tests where parse_response() is mocked."""
+
 
 @pytest.fixture
 def opus(qtbot) -> OPUSInterface:
@@ -152,7 +155,7 @@ def test_handle_response_status_changed(
 
     # Check the status update is sent
     with patch.object(opus, "send_status_message") as status_mock:
-        opus.handle_response(MagicMock())
+        opus.handle_response(RESPONSE)
         assert opus._status == SpectrometerStatus.CONNECTED
         status_mock.assert_called_once_with(SpectrometerStatus.CONNECTED)
 
@@ -167,10 +170,28 @@ def test_handle_response_status_unchanged(
 
     # Check the status is send
     with patch.object(opus, "send_status_message") as status_mock:
-        opus.handle_response(MagicMock())
+        opus.handle_response(RESPONSE)
         status_mock.assert_not_called()
 
 
+@patch("frog.hardware.plugins.spectrometer.opus_interface.parse_response")
+def test_handle_response_same_response(
+    parse_response_mock: Mock, opus: OPUSInterface, qtbot
+) -> None:
+    """Test the handle_response() method doesn't reparse identical responses."""
+    parse_response_mock.return_value = SpectrometerStatus.CONNECTED
+
+    with patch.object(opus, "send_status_message") as status_mock:
+        opus.handle_response(RESPONSE)
+        opus.handle_response(RESPONSE)
+        parse_response_mock.assert_called_once_with(RESPONSE)
+        status_mock.assert_called_once_with(SpectrometerStatus.CONNECTED)
+
+        # A different response should be parsed
+        opus.handle_response("OTHER RESPONSE")
+        assert parse_response_mock.call_count == 2
+
+
 @patch("frog.hardware.plugins.spectrometer.opus_interface.parse_response")
 def test_on_reply_received_exception(
     parse_response_mock: Mock, opus: OPUSInterface, qtbot
@@ -180,4 +201,4 @@ def test_on_reply_received_exception(
     parse_response_mock.side_effect = RuntimeError
 
     with pytest.raises(RuntimeError):
-        opus.handle_response(MagicMock())
+        opus.handle_response(RESPONSE)
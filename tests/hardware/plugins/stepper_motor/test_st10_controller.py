@@ -3,7 +3,7 @@
 from contextlib import nullcontext as does_not_raise
 from itertools import chain
 from typing import Any, cast
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
 import pytest
 from serial import SerialException, SerialTimeoutException
@@ -27,10 +27,13 @@ class MockSerialReader(_SerialReader):
         self.read_error = MagicMock()
         super().__init__(*args, **kwargs)
 
+    def start(self, *args: Any, **kwargs: Any) -> None:
+        """Override the start method so that no thread is started."""
+
     def run(self) -> None:
         """Override the run method to make the thread do nothing."""
 
-    def read_sync(self) -> str:
+    def read_sync(self) -> bytes:
         """Read synchronously (mocked)."""
         self._process_read()
         return super().read_sync()
@@ -87,10 +90,18 @@ def test_init(subscribe_mock: MagicMock, serial_mock: MagicMock) -> None:
 @patch("frog.hardware.plugins.stepper_motor.st10_controller.StepperMotorBase")
 def test_close(stepper_cls: Mock, serial_dev_cls: Mock, dev: ST10Controller) -> None:
     """Test the close() method."""
-    with patch.object(dev, "move_to") as move_mock:
+    with (
+        patch.object(dev, "move_to") as move_mock,
+        patch.object(dev._reader, "wait", return_value=True) as wait_mock,
+    ):
         dev.close()
         move_mock.assert_called_once_with("nadir")
 
+        # Check that the reader thread is stopped before the port is closed
+        assert dev._reader.stopping
+        dev.serial.cancel_read.assert_called_once_with()
+        wait_mock.assert_called_once_with(2000)
+
     # Check that both parents' close() methods are called
     stepper_cls.close.assert_called_once_with(dev)
     serial_dev_cls.close.assert_called_once_with(dev)
@@ -131,18 +142,16 @@ def test_close_already_closed(
 
 def test_on_initial_move_end(dev: ST10Controller) -> None:
     """Test the _on_initial_move_end() method."""
-    with patch.object(dev, "_init_error_timer") as timer_mock:
-        with patch.object(dev, "_reader") as reader_mock:
-            with patch.object(dev, "signal_is_opened") as signal_mock:
-                dev._on_initial_move_end()
-                reader_mock.async_read_completed.disconnect.assert_called_once_with(
-                    dev._on_initial_move_end
-                )
-                reader_mock.async_read_completed.connect.assert_called_once_with(
-                    dev._on_move_end
-                )
-                timer_mock.stop.assert_called_once_with()
-                signal_mock.assert_called_once_with()
+    with patch.object(dev, "_reader") as reader_mock:
+        with patch.object(dev, "signal_is_opened") as signal_mock:
+            dev._on_initial_move_end()
+            reader_mock.async_read_completed.disconnect.assert_called_once_with(
+                dev._on_initial_move_end
+            )
+            reader_mock.async_read_completed.connect.assert_called_once_with(
+                dev._on_move_end
+            )
+            signal_mock.assert_called_once_with()
 
 
 @patch(
@@ -191,8 +200,8 @@ def test_send_move_end_message(
 
 
 def read_mock(dev: ST10Controller, return_value: str):
-    """Patch the _read_sync() method of dev."""
-    return patch.object(dev, "_read_sync", return_value=return_value)
+    """Patch the _read_sync() method of dev to return the encoded string."""
+    return patch.object(dev, "_read_sync", return_value=return_value.encode("ascii"))
 
 
 def test_write(dev: ST10Controller) -> None:
@@ -206,7 +215,7 @@ def test_read_normal(dev: ST10Controller) -> None:
     dev.serial.read_until.return_value = b"hello\r"
     ret = dev._read_sync()
     dev.serial.read_until.assert_called_with(b"\r")
-    assert ret == "hello"
+    assert ret == b"hello"
 
 
 def test_read_error(dev: ST10Controller) -> None:
@@ -231,6 +240,71 @@ def test_read_timed_out(dev: ST10Controller) -> None:
             dev._read_sync()
 
 
+@patch("frog.hardware.plugins.stepper_motor.st10_controller.time.monotonic")
+def test_read_async_deadline(monotonic_mock: Mock, dev: ST10Controller) -> None:
+    """Test that a read waits no longer than the async deadline."""
+    monotonic_mock.return_value = 1.0
+    dev._reader.async_deadline = 3.0
+    dev.serial.read_until.return_value = b"Z\r"
+    dev._reader._process_read()
+    assert dev.serial.timeout == 2.0
+    assert dev._reader.async_deadline is None
+    reader = cast(MagicMock, dev._reader)
+    reader.async_read_completed.emit.assert_called_once_with()
+
+    # The next read should block until a message is received
+    dev._reader._process_read()
+    assert dev.serial.timeout is None
+
+
+@patch("frog.hardware.plugins.stepper_motor.st10_controller.time.monotonic")
+def test_read_async_deadline_expired(monotonic_mock: Mock, dev: ST10Controller) -> None:
+    """Test that an error is signalled if the async deadline expires."""
+    monotonic_mock.return_value = 1.0
+    dev._reader.async_deadline = 3.0
+
+    # Only part of a message is received before the read times out
+    dev.serial.read_until.return_value = b"he"
+    assert dev._reader._process_read()
+    assert dev._reader.async_deadline is None
+    reader = cast(MagicMock, dev._reader)
+    reader.read_error.emit.assert_called_once()
+    assert dev._reader.out_queue.empty()
+
+    # The rest of the message should be kept
+    dev.serial.read_until.return_value = b"llo\r"
+    assert dev._read_sync() == b"hello"
+    assert dev.serial.timeout is None
+
+
+@patch("frog.hardware.plugins.stepper_motor.st10_controller.time.monotonic")
+def test_read_async_deadline_cleared_during_read(
+    monotonic_mock: Mock, dev: ST10Controller
+) -> None:
+    """Test clearing the async deadline while a read is in progress."""
+    monotonic_mock.return_value = 1.0
+    dev._reader.async_deadline = 3.0
+
+    def read_until(expected: bytes) -> bytes:
+        # Simulate another thread clearing the deadline before the read times out
+        dev._reader.clear_async_deadline()
+        assert dev.serial.timeout == 2.0
+        return b""
+
+    dev.serial.read_until.side_effect = read_until
+    assert dev._reader._process_read()
+
+    # No error should be signalled, as we are no longer waiting
+    reader = cast(MagicMock, dev._reader)
+    reader.read_error.emit.assert_not_called()
+
+    # The serial timeout should be reset by the reader on its next read
+    dev.serial.read_until.side_effect = None
+    dev.serial.read_until.return_value = b"hello\r"
+    assert dev._read_sync() == b"hello"
+    assert dev.serial.timeout is None
+
+
 def test_read_non_ascii(dev: ST10Controller) -> None:
     """Test the _read_sync() method with a non-ASCII response."""
     dev.serial.read_until.return_value = b"\xff\r"
@@ -368,8 +442,8 @@ def test_get_input_status(
     expected: bool,
 ) -> None:
     """Test the _get_input_status() method."""
-    with patch.object(dev, "_request_value") as request_mock:
-        request_mock.return_value = f"{all_bits:3b}"
+    with patch.object(dev, "_request_raw_value") as request_mock:
+        request_mock.return_value = f"{all_bits:3b}".encode("ascii")
         assert dev._get_input_status(input) == expected
         request_mock.assert_called_once_with("IS")
 
@@ -377,8 +451,8 @@ def test_get_input_status(
 @pytest.mark.parametrize("input", (-1, 0, 4, 10))
 def test_get_input_status_bad(dev: ST10Controller, input: int):
     """Test the _get_input_status() method fails for an out-of-range input."""
-    with patch.object(dev, "_request_value") as request_mock:
-        request_mock.return_value = f"{_ALL_BITS:3b}"
+    with patch.object(dev, "_request_raw_value") as request_mock:
+        request_mock.return_value = f"{_ALL_BITS:3b}".encode("ascii")
         with pytest.raises(ValueError):
             dev._get_input_status(input)
 
@@ -391,19 +465,41 @@ def test_steps_per_rotation(dev: ST10Controller) -> None:
 @pytest.mark.parametrize("in_position", (True, False))
 def test_home_and_reset(dev: ST10Controller, in_position: bool) -> None:
     """Test the _home_and_reset() method."""
-    with patch.object(dev, "_send_string") as ss_mock:
-        with patch.object(dev, "stop_moving") as stop_mock:
-            with patch.object(dev, "_relative_move"):
-                with patch.object(dev, "_write_check"):
-                    with patch.object(dev, "_init_error_timer") as timer_mock:
-                        with patch.object(dev, "_get_input_status") as status_mock:
-                            # Let's not bother checking everything as we can't ensure
-                            # the sequence is correct in any case
-                            status_mock.return_value = in_position
-                            dev._home_and_reset(0)
-                            stop_mock.assert_called_once_with()
-                            timer_mock.start.assert_called_once_with()
-                            ss_mock.assert_called_once_with("Z")
+    with (
+        patch.object(dev, "stop_moving") as stop_mock,
+        patch.object(dev, "_relative_move") as move_mock,
+        patch.object(dev, "_write_check") as write_mock,
+        patch.object(dev, "_notify_on_stopped") as notify_mock,
+        patch.object(dev, "_get_input_status") as status_mock,
+    ):
+        status_mock.return_value = in_position
+        dev._home_and_reset(180)
+        stop_mock.assert_called_once_with()
+        move_calls = [call(25400)]
+        if in_position:
+            move_calls.insert(0, call(-5000))
+        assert move_mock.call_args_list == move_calls
+        assert write_mock.call_args_list == [call("SH6H"), call("SP0")]
+        notify_mock.assert_called_once_with()
+        assert dev._reader.async_deadline is not None
+
+
+def test_home_and_reset_error(dev: ST10Controller) -> None:
+    """Test that _home_and_reset() stops at the first error and clears the deadline."""
+    with (
+        patch.object(dev, "stop_moving"),
+        patch.object(dev, "_get_input_status", return_value=False),
+        patch.object(dev, "_relative_move") as move_mock,
+        patch.object(dev, "_notify_on_stopped") as notify_mock,
+        patch.object(dev, "_write_check", side_effect=ST10ControllerError),
+    ):
+        with pytest.raises(ST10ControllerError):
+            dev._home_and_reset(180)
+
+        # No further commands should be sent if homing fails
+        move_mock.assert_not_called()
+        notify_mock.assert_not_called()
+        assert dev._reader.async_deadline is None
 
 
 @pytest.mark.parametrize("steps", range(0, 40, 7))
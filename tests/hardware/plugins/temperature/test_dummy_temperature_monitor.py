@@ -0,0 +1,51 @@
+"""Tests for the DummyTemperatureMonitor class."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from frog.config import NUM_TEMPERATURE_MONITOR_CHANNELS
+from frog.hardware.noise_producer import NoiseParameters
+from frog.hardware.plugins.temperature.dummy_temperature_monitor import (
+    DummyTemperatureMonitor,
+)
+
+_PARAMS = [
+    NoiseParameters(mean=float(i), standard_deviation=0.0, seed=i)
+    for i in range(NUM_TEMPERATURE_MONITOR_CHANNELS)
+]
+
+
+def test_init_bad_params() -> None:
+    """Test that the wrong number of parameters raises an error."""
+    with pytest.raises(ValueError):
+        DummyTemperatureMonitor(_PARAMS[1:])
+
+
+def test_get_temperatures() -> None:
+    """Test the get_temperatures() method."""
+    dev = DummyTemperatureMonitor(_PARAMS)
+    temperatures = dev.get_temperatures()
+    assert temperatures == list(range(NUM_TEMPERATURE_MONITOR_CHANNELS))
+
+    # Like the real temperature monitors, the values should be Decimals
+    assert all(isinstance(temp, Decimal) for temp in temperatures)
+
+    # Previous readings should not be overwritten by later ones
+    dev.get_temperatures()
+    assert temperatures == list(range(NUM_TEMPERATURE_MONITOR_CHANNELS))
+
+
+def test_get_temperatures_seeds() -> None:
+    """Test that each channel honours its own seed."""
+    params = [
+        NoiseParameters(mean=0.0, standard_deviation=1.0, seed=seed)
+        for seed in (None, *range(1, NUM_TEMPERATURE_MONITOR_CHANNELS))
+    ]
+    temps1 = DummyTemperatureMonitor(params).get_temperatures()
+    temps2 = DummyTemperatureMonitor(params).get_temperatures()
+
+    # Seeded channels should be reproducible, even if another channel is unseeded
+    assert temps1[1:] == temps2[1:]
+    assert temps1[1] == Decimal(np.random.default_rng(1).normal(0.0, 1.0))
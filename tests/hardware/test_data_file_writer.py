@@ -171,6 +171,29 @@ def test_write_moving(
     sendmsg_mock.assert_called_once_with("data_file.writing")
 
 
+@patch("frog.hardware.data_file_writer._get_hot_bb_power")
+@patch("frog.hardware.data_file_writer._get_stepper_motor_angle")
+def test_write_date_change(
+    get_angle_mock: Mock,
+    get_power_mock: Mock,
+    writer: DataFileWriter,
+    sendmsg_mock: Mock,
+) -> None:
+    """Test the write() method updates the date when the day changes."""
+    get_angle_mock.return_value = (90.0, False)
+    get_power_mock.return_value = 10
+    writer._writer = MagicMock()
+
+    writer.write(datetime(2023, 4, 14, 23, 59, 59), [])
+    writer.write(datetime(2023, 4, 15, 0, 0, 1), [])
+    writer._writer.writerow.assert_has_calls(
+        (
+            call(("20230414", "23:59:59", 86399, 90.0, False, 10)),
+            call(("20230415", "00:00:01", 1, 90.0, False, 10)),
+        )
+    )
+
+
 @patch("frog.hardware.data_file_writer.get_temperature_controller_instance")
 @patch("frog.hardware.data_file_writer.get_stepper_motor_instance")
 def test_write_error(
@@ -80,25 +80,32 @@ def test_get_device_types(load_plugins_mock: Mock) -> None:
         device_mock.get_device_type_info.return_value = info_mock
         device_types.append(device_mock)
 
-    with patch("frog.hardware.device._base_types", base_types):
-        with patch("frog.hardware.device._device_types", device_types):
-            device_types_out = get_device_types()
-            load_plugins_mock.assert_called_once_with()
+    with (
+        patch("frog.hardware.device._plugins_loaded", False),
+        patch("frog.hardware.device._base_types", base_types),
+        patch("frog.hardware.device._device_types", device_types),
+    ):
+        device_types_out = get_device_types()
+        load_plugins_mock.assert_called_once_with()
+
+        keys = list(device_types_out.keys())
 
-            keys = list(device_types_out.keys())
+        # Check that keys are present and sorted
+        assert [key.description for key in keys] == [
+            "BaseTypeA",
+            "BaseTypeB",
+        ]
 
-            # Check that keys are present and sorted
-            assert [key.description for key in keys] == [
-                "BaseTypeA",
-                "BaseTypeB",
-            ]
+        def get_names(idx):
+            return [t.description for t in device_types_out[keys[idx]]]
 
-            def get_names(idx):
-                return [t.description for t in device_types_out[keys[idx]]]
+        # Check that device types are all present and sorted by name
+        assert get_names(0) == ["Device1"]
+        assert get_names(1) == ["Device0", "Device2"]
 
-            # Check that device types are all present and sorted by name
-            assert get_names(0) == ["Device1"]
-            assert get_names(1) == ["Device0", "Device2"]
+        # Plugins should only be loaded once
+        get_device_types()
+        load_plugins_mock.assert_called_once_with()
 
 
 def test_abstract_device_add_parameters_description_only() -> None:
@@ -125,6 +132,40 @@ def test_abstract_device_add_parameters_possible_values() -> None:
     }
 
 
+def test_abstract_device_add_parameters_lazy() -> None:
+    """Test adding a device parameter whose possible values are computed lazily."""
+    get_values = MagicMock(return_value=("a", "b"))
+
+    class MyDevice(
+        AbstractDevice, parameters={"my_param": ("My parameter", get_values)}
+    ):
+        def __init__(self, my_param: str) -> None:
+            pass
+
+    class MyDeviceSubclass(MyDevice):
+        pass
+
+    # The values should not be computed until they are needed
+    get_values.assert_not_called()
+
+    possible_values = MyDevice.get_device_parameters()["my_param"].possible_values
+    assert isinstance(possible_values, Sequence)
+    assert list(possible_values) == ["a", "b"]
+    assert "b" in possible_values
+    assert possible_values[1] == "b"
+    assert len(possible_values) == 2
+    assert MyDeviceSubclass.get_device_parameters() == {
+        "my_param": DeviceParameter("My parameter", ("a", "b"))
+    }
+
+    # The values should not be cached, so changes are picked up
+    get_values.return_value = ("c",)
+    assert list(possible_values) == ["c"]
+    assert MyDeviceSubclass.get_device_parameters() == {
+        "my_param": DeviceParameter("My parameter", ("c",))
+    }
+
+
 def test_abstract_device_add_parameters_missing_arg() -> None:
     """Test that an error is raised for a missing parameter."""
     with pytest.raises(ValueError):
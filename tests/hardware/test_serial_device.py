@@ -9,12 +9,24 @@ from serial import SerialException
 from frog.hardware.serial_device import (
     SerialDevice,
     _create_serial,
+    _get_device_dir_mtime,
     _get_port_parts,
     _get_serial_ports,
     _port_info_to_str,
 )
 
 
+@pytest.fixture(autouse=True)
+def dev_mtime_mock():
+    """Pretend that the device directory is never modified."""
+    with (
+        patch("frog.hardware.serial_device._get_device_dir_mtime") as mtime_mock,
+        patch("frog.hardware.serial_device._serial_ports_dev_mtime", 1.0),
+    ):
+        mtime_mock.return_value = 1.0
+        yield mtime_mock
+
+
 @patch("frog.hardware.serial_device.comports")
 def test_get_serial_ports_cached(comports_mock: Mock) -> None:
     """Check that _get_serial_ports() works when results have been cached."""
@@ -24,6 +36,53 @@ def test_get_serial_ports_cached(comports_mock: Mock) -> None:
         comports_mock.assert_not_called()
 
 
+@patch("frog.hardware.serial_device.comports")
+def test_get_serial_ports_dev_modified(
+    comports_mock: Mock, dev_mtime_mock: Mock
+) -> None:
+    """Check that the serial ports are rescanned if the device directory changed."""
+    dev_mtime_mock.return_value = 2.0
+    comports_mock.return_value = []
+    with patch("frog.hardware.serial_device._serial_ports", {"key": "value"}):
+        assert _get_serial_ports() == {}
+        comports_mock.assert_called_once_with()
+
+
+@patch("frog.hardware.serial_device.os.stat")
+def test_get_device_dir_mtime(stat_mock: Mock) -> None:
+    """Test _get_device_dir_mtime()."""
+    stat_mock.return_value.st_mtime = 42.0
+    with patch("frog.hardware.serial_device.os.name", "posix"):
+        assert _get_device_dir_mtime() == 42.0
+
+        stat_mock.side_effect = FileNotFoundError
+        assert _get_device_dir_mtime() is None
+
+
+@patch("frog.hardware.serial_device.os.stat")
+def test_get_device_dir_mtime_not_posix(stat_mock: Mock) -> None:
+    """Test _get_device_dir_mtime() doesn't look for a device directory on Windows."""
+    with patch("frog.hardware.serial_device.os.name", "nt"):
+        assert _get_device_dir_mtime() is None
+    stat_mock.assert_not_called()
+
+
+@patch("frog.hardware.serial_device.comports")
+@patch("frog.hardware.serial_device.time.monotonic")
+def test_get_serial_ports_refresh_too_soon(
+    monotonic_mock: Mock, comports_mock: Mock
+) -> None:
+    """Check that the serial ports aren't rescanned if they were just refreshed."""
+    monotonic_mock.return_value = 10.0
+    serial_ports = {"key": "value"}
+    with (
+        patch("frog.hardware.serial_device._serial_ports", serial_ports),
+        patch("frog.hardware.serial_device._serial_ports_time", 9.9),
+    ):
+        assert _get_serial_ports(refresh=True) == serial_ports
+        comports_mock.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "refresh,serial_ports", ((False, None), (True, {"key": "value"}))
 )
@@ -50,7 +109,10 @@ def test_get_serial_ports(
 
     comports_mock.return_value = ports
 
-    with patch("frog.hardware.serial_device._serial_ports", serial_ports):
+    with (
+        patch("frog.hardware.serial_device._serial_ports", serial_ports),
+        patch("frog.hardware.serial_device._serial_ports_time", float("-inf")),
+    ):
         assert _get_serial_ports(refresh) == {
             _port_info_to_str(VID, PID, 0): "COM1",
             "COM2": "COM2",
@@ -58,6 +120,13 @@ def test_get_serial_ports(
         }
 
 
+def test_port_info_to_str() -> None:
+    """Test _port_info_to_str()."""
+    assert _port_info_to_str(0x1234, 0xABCD) == "1234:abcd"
+    assert _port_info_to_str(1, 2, 0) == "0001:0002"
+    assert _port_info_to_str(1, 2, 1) == "0001:0002 (2)"
+
+
 def test_get_port_parts() -> None:
     """Test _get_port_parts()."""
     for prefix in ("COM", "/dev/ttyUSB"):
@@ -66,6 +135,9 @@ def test_get_port_parts() -> None:
     assert _get_port_parts("A1") < _get_port_parts("B1")
     assert _get_port_parts("A") < _get_port_parts("A0")
     assert _get_port_parts("A") < _get_port_parts("B")
+    assert _get_port_parts("/dev/ttyUSB10") == ("/dev/ttyUSB", 10)
+    assert _get_port_parts("COM") == ("COM", -1)
+    assert _get_port_parts("") == ("", -1)
 
 
 @pytest.mark.parametrize("refresh", (False, True))